@@ -127,10 +127,11 @@ class QuartoApp(App):
         """
         QuartoApp.setup_instructions()
         QuartoApp.setup_pause_menu()
-        QuartoApp.keyboard = Keyboard(self)
+        screen_manager = QuartoApp.get_screen_manager()
+        QuartoApp.keyboard = Keyboard(self)  # Binds to the ScreenManager
         self.title = "Quarto"
         self.icon = str(Path("assets", "icon.png"))
-        return QuartoApp.get_screen_manager()
+        return screen_manager
 
 
 if __name__ == "__main__":
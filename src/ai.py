@@ -18,124 +18,158 @@ __all__ = [
 __version__ = "1.4.0"
 __author__ = "Eric G.D"
 
-from copy import deepcopy
+from collections.abc import Iterator
+from functools import cache
+from itertools import permutations
 from math import inf
+from operator import itemgetter
 import random
-from time import time
+from time import monotonic
 
 import numpy as np
 
-from src.constants import BOTH_ATTRIBUTES, MAX_SCORE, MAX_TIME, NO_ATTRIBUTES
+from src.constants import (
+    MAX_SCORE,
+    MAX_TIME,
+    NO_PIECE,
+)
 from src.option import (
     GameState,
     Option,
     Transposition,
     TTFlag,
 )
-from src.piece import Piece
+from src.piece import PIECES, Piece
+
+
+def get_winning_lines(length: int) -> tuple[tuple[int, ...], ...]:
+    """
+    :param length:  The length of the board
+    :return:        The flattened indices of the cells of every row, column and diagonal
+    """
+    rows = [tuple(i * length + j for j in range(length)) for i in range(length)]
+    cols = [tuple(i * length + j for i in range(length)) for j in range(length)]
+    diagonals = [
+        tuple(i * length + i for i in range(length)),
+        tuple(i * length + length - i - 1 for i in range(length)),
+    ]
+    return tuple(rows + cols + diagonals)
+
+
+def get_symmetry_indices(length: int) -> list[tuple[int, ...]]:
+    """
+    :param length:  The length of the board
+    :return:        For every flip and rotation of the board, the cell each of its cells is taken from
+    """
+    indices = np.arange(length**2).reshape(length, length)
+    flips = [np.flipud(indices), np.fliplr(indices)]
+    rotations = [np.rot90(indices, i) for i in range(1, 4)]
+    rotated_flips = [np.rot90(flip, i) for flip in flips for i in range(1, 4)]
+    symmetries = (
+        tuple(matrix.flatten().tolist()) for matrix in rotations + flips + rotated_flips
+    )
+    return list(dict.fromkeys(symmetries))  # Rotated flips repeat some transformations
+
+
+def get_attribute_transforms(num_of_attributes: int) -> list[tuple[int, ...]]:
+    """
+    Swapping attributes between each other or flipping an attribute's values for every piece doesn't change the game
+
+    :param num_of_attributes:   The number of attributes a piece has
+    :return:                    Every such transformation, as a table of the piece id each piece id is mapped to
+    """
+    num_of_pieces = 2**num_of_attributes
+    transforms = []
+    for order in permutations(range(num_of_attributes)):
+        permuted = [
+            sum((num >> bit & 1) << order[bit] for bit in range(num_of_attributes))
+            for num in range(num_of_pieces)
+        ]
+        transforms += [
+            tuple(num ^ flipped for num in permuted) for flipped in range(num_of_pieces)
+        ]
+    return transforms
+
+
+WINNING_LINE_CELLS: tuple[tuple[int, ...], ...] = get_winning_lines(GameState.LENGTH)
+SYMMETRY_INDICES: list[tuple[int, ...]] = get_symmetry_indices(GameState.LENGTH)
+SYMMETRY_GETTERS: list[itemgetter] = [
+    itemgetter(*indices) for indices in SYMMETRY_INDICES
+]  # Gather all the cells of a symmetry in a single C call
+ALL_PIECES: int = (1 << len(PIECES)) - 1  # A mask with every piece id
+COMPLEMENTS: bytes = bytes(
+    num ^ Piece.MAX_NUM if num <= Piece.MAX_NUM else NO_PIECE for num in range(256)
+)  # bytes.translate tables, mapping a cell to its piece's unset attributes
+PRESENCES: bytes = bytes(int(num <= Piece.MAX_NUM) for num in range(256))
+ATTRIBUTE_TRANSFORMS: list[tuple[int, ...]] = get_attribute_transforms(
+    Piece.NUM_OF_ATTRIBUTES
+)
 
 
 def has_won(state: GameState) -> bool:
     """
     :param state:   The current GameState
-    :return:        True if the board is full, false otherwise
+    :return:        True if a row, column or diagonal is full and shares an attribute, false otherwise
     """
-    return evaluate(state)[0] == MAX_SCORE
+    cells = state.board
+    for a, b, c, d in WINNING_LINE_CELLS:  # Unrolled for the 4x4 board
+        p, q, r, s = cells[a], cells[b], cells[c], cells[d]
+        if NO_PIECE in (p, q, r, s):
+            continue  # Only full lines can win, so their attributes aren't needed
+        if p & q & r & s or ~(p | q | r | s) & Piece.MAX_NUM:
+            return True
+    return False
 
 
-def evaluate(state: GameState) -> tuple[int, list[int]]:
+def evaluate(state: GameState) -> tuple[int, tuple[int, int]]:
     """
     :param state:       The GameState to evaluate
-    :return:            :board:'s static evaluation and what attributes the next piece needs to have in order to win
+    :return:            :board:'s static evaluation and the masks of the attributes the next piece needs to have set
+                        or unset in order to win (An attribute in both masks means every piece wins)
     """
-    length = len(state)
+    if state.evaluation is not None:  # Evaluated by the parent node, to sort its moves
+        return state.evaluation
+    cached = GameState.evaluation_table.get(state.board)
+    if cached is not None:
+        state.evaluation = cached
+        return cached
+    length = GameState.LENGTH
     assert length == Piece.NUM_OF_ATTRIBUTES
-    rows = get_rows_from_board(state)
+    cells = state.board
+    # Translated for the whole board at once, an empty cell becomes NO_PIECE / 0 so it doesn't affect the line
+    complements, presences = cells.translate(COMPLEMENTS), cells.translate(PRESENCES)
     row_scores = []
-    winning_attributes = [NO_ATTRIBUTES] * Piece.NUM_OF_ATTRIBUTES
-    for row in rows:
-        attributes, num_of_pieces = calculate_row_attributes(row)
-        attributes_num = (
-            length - attributes.count(NO_ATTRIBUTES) if num_of_pieces > 1 else 0
-        )
+    winning_set = winning_unset = 0
+    for a, b, c, d in WINNING_LINE_CELLS:  # Unrolled for the 4x4 board
+        num_of_pieces = presences[a] + presences[b] + presences[c] + presences[d]
+        if num_of_pieces <= 1:
+            continue
+        shared_set = cells[a] & cells[b] & cells[c] & cells[d] & Piece.MAX_NUM
+        shared_unset = (
+            complements[a] & complements[b] & complements[c] & complements[d]
+        ) & Piece.MAX_NUM
+        attributes_num = (shared_set | shared_unset).bit_count()
         if attributes_num == 0:
             continue
         if num_of_pieces == length:
             row_scores[:] = [MAX_SCORE]
             break
         if num_of_pieces == length - 1:
-            next_move_wins = update_winning_attributes(winning_attributes, attributes)
+            # The next player has a guaranteed win if this row needs the opposite of a previous row
+            next_move_wins = shared_set & winning_unset or shared_unset & winning_set
+            winning_set |= shared_set
+            winning_unset |= shared_unset
             if next_move_wins:
                 row_scores.append(-MAX_SCORE // 2)
                 continue
         row_scores.append(
             (2**num_of_pieces) * attributes_num
         )  # Multiple shared attributes count as multiple rows
-    score = sum(row_scores)
-    return score, winning_attributes
-
-
-def get_rows_from_board(board: GameState) -> list[list[Piece]]:
-    """
-    :param board:   The current gamestate that is being evaluated
-    :return:        A list of all the rows in the board
-    """
-    length = len(board)
-    rows = [[] for _ in range(length)]
-    cols = [[] for _ in range(length)]
-    diagonals = [[] for _ in range(2)]
-    for i in range(length):
-        for j in range(length):
-            piece = board[i][j]
-            rows[i].append(piece)
-            cols[j].append(piece)
-            if i == j:
-                diagonals[0].append(piece)
-            if i == length - j - 1:
-                diagonals[1].append(piece)
-    return rows + cols + diagonals
-
-
-def calculate_row_attributes(row: list[Piece]) -> tuple[list[bool | int], int]:
-    """
-    :param row:     A row in the board
-    :return:        A tuple containing the shared attributes and the number of pieces
-    """
-    attributes, num_of_pieces = [], 0
-    for piece in row:
-        if piece is None:
-            continue
-        attributes[:] = (
-            piece.attributes
-            if num_of_pieces == 0
-            else map(
-                lambda x, y: x if x == y else NO_ATTRIBUTES,
-                attributes,
-                piece.attributes,
-            )
-        )
-        # [:] in order to avoid casting and mutate the list
-        num_of_pieces += 1
-    return attributes, num_of_pieces
-
-
-def update_winning_attributes(
-    winning_attributes: list[bool | int], attributes: list[bool | int]
-) -> bool:
-    """
-    :param winning_attributes:  The shared attributes of previous 3-in-a-row rows
-    :param attributes:          The attributes of the current 3-in-a-row row
-    :return:                    If the next player has a guaranteed win the next turn
-    """
-    assert len(winning_attributes) == len(attributes) == Piece.NUM_OF_ATTRIBUTES
-    next_move_wins = False
-    for i in range(len(winning_attributes)):
-        if winning_attributes[i] == NO_ATTRIBUTES:
-            winning_attributes[i] = attributes[i]
-        elif attributes[i] not in (NO_ATTRIBUTES, winning_attributes[i]):
-            winning_attributes[i] = BOTH_ATTRIBUTES
-            next_move_wins = True
-    return next_move_wins
+    # Kept above -MAX_SCORE however many lines conflict, so only a finished game can reach MAX_SCORE
+    score = max(sum(row_scores), 1 - MAX_SCORE)
+    state.evaluation = score, (winning_set, winning_unset)
+    GameState.evaluation_table[state.board] = state.evaluation
+    return state.evaluation
 
 
 def pick_starting_piece(pieces_set: set[Piece]) -> Piece:
@@ -153,124 +187,169 @@ def pick_best(board: GameState, piece: Piece, pieces_set: set[Piece]) -> Option:
     :param pieces_set:  A set of available pieces to play
     :return:            The move with the highest score
     """
-    pieces_set.remove(piece)
-    options = get_options(board, piece, pieces_set, best_moves=True)
-    blacklist = evaluate(options[0].game_state)[
-        1
-    ]  # All GameStates in options are the same
-    option = options.pop(0)
-    while len(options) > 0 and shared_attributes(option.piece.attributes, blacklist):
-        option = options.pop(0)
-    return option
+    pieces = get_pieces_mask(pieces_set) & ~(1 << piece.id)
+    option, i, j, ids = get_placements(board, piece, pieces)[0]
+    return Option(option, PIECES[ids[0]], i, j)  # Safe to give, if any piece is
 
 
 def get_options(
-    board: GameState, piece: Piece, pieces_set: set[Piece], best_moves: bool = False
-) -> list[Option]:
+    board: GameState,
+    piece: Piece,
+    pieces: int,
+    sign: int = 1,
+    best_move: Option | None = None,
+) -> Iterator[Option]:
+    """
+    Lazily yields the moves of the placements from get_placements, so a cutoff stops the iteration early
+    :param board:       The current GameState
+    :param piece:       The piece to insert
+    :param pieces:      A mask of the ids of all playable pieces
+    :param sign:        The sign of the player making the move (+1 for computer, -1 for human)
+    :param best_move:   The best move of a previous search, which is yielded first
+    :return:            An iterator of all possible moves
+
+    .. seealso::        https://www.chessprogramming.org/Hash_Move
+    """
+    if best_move is not None:
+        yield best_move  # If it causes a cutoff, the other moves are never generated
+    # Moves of the same node only differ by their index and piece
+    best_index = best_move.index if best_move is not None else None
+    best_id = best_move.piece.id if best_move is not None else None
+    for option, i, j, ids in get_placements(board, piece, pieces, sign):
+        for num in ids:
+            if num != best_id or (i, j) != best_index:
+                yield Option(option, PIECES[num], i, j)
+
+
+def get_placements(
+    board: GameState, piece: Piece, pieces: int, sign: int = 1
+) -> list[tuple[GameState, int, int, list[int]]]:
     """
     :param board:               The current GameState
     :param piece:               The piece to insert
-    :param pieces_set:          A set containing all playable moves
-    :param best_moves:          If creating an options list for the pick_best function
-    :return:                    A list of all possible moves
+    :param pieces:              A mask of the ids of all playable pieces
+    :param sign:                The sign of the player making the move (+1 for computer, -1 for human)
+    :return:                    The possible placements, best first for :sign:, as their GameState, insertion index
+                                and the ids of the pieces that can be given after them
     """
-    if piece in pieces_set:
-        raise ValueError(":pieces_set: should contain :piece:!")
+    if pieces >> piece.id & 1:
+        raise ValueError(":pieces: shouldn't contain :piece:!")
     out = []
-    for i in range(len(board)):
-        for j in range(len(board[i])):
-            if board[i][j] is not None:
-                continue
-            option = deepcopy(board)
-            option[i][j] = piece
-            if contains_symmetries(out, option):
-                continue
-            score, black_list = evaluate(option)
-            if not out or BOTH_ATTRIBUTES not in black_list:
-                option_list = get_playable_moves(option, pieces_set, i, j, black_list)
-                tt_entry = GameState.transposition_table.get(option_list[0])
-                score = tt_entry.value if tt_entry is not None else score
-                out.append((option_list, score))
+    seen = set()  # Canonical forms of the placements so far
+    cells = board.board
+    # Every piece that isn't playable is in the board once :piece: is placed
+    pieces = get_distinct_pieces(pieces, ALL_PIECES & ~pieces)
+    scratch = bytearray(cells)  # Each placement is made and undone in place
+    for k, piece_id in enumerate(cells):
+        if piece_id != NO_PIECE:
+            continue
+        scratch[k] = piece.id
+        option = GameState(scratch)  # Copies the scratch buffer into immutable bytes
+        scratch[k] = NO_PIECE
+        canonical_form = get_canonical_form(option.board)
+        if canonical_form in seen:  # A flip or rotation of a previous placement
+            continue
+        seen.add(canonical_form)
+        score, black_list = evaluate(option)
+        winning_set, winning_unset = black_list
+        if not out or not winning_set & winning_unset:
+            i, j = divmod(k, GameState.LENGTH)
+            ids = get_playable_pieces(pieces, black_list)
+            tt_entry = GameState.transposition_table.get(
+                Option(option, PIECES[ids[0]], i, j)
+            )
+            # Both scores are from the point of view of the player making the move
+            if tt_entry is not None:
+                score = -tt_entry.value
+            elif score != MAX_SCORE:  # A win is the best move for either player
+                score *= sign
+            out.append(((option, i, j, ids), score))
     assert len(out) > 0
-    out.sort(
-        key=lambda x: x[1], reverse=True
-    )  # Sort moves by base score in descending order
-    return (
-        out[0][0] if best_moves else [x for option_list in out for x in option_list[0]]
+    out.sort(key=lambda x: x[1], reverse=True)  # Best moves first
+    return [placement for placement, _ in out]
+
+
+def get_distinct_pieces(pieces: int, placed: int) -> int:
+    """
+    Removes pieces that an attribute transformation fixing the board maps onto another playable piece,
+    as giving either of them leads to equivalent games
+
+    :param pieces:      A mask of the ids of all playable pieces
+    :param placed:      A mask of the ids of the pieces in the board
+    :return:            A mask of the ids of one piece of each group of equivalent pieces
+    """
+    stabilizer = get_stabilizer(placed)
+    if len(stabilizer) == 1:  # Only the identity, which is the case for most boards
+        return pieces
+    return sum(
+        1 << num
+        for num in get_ids(pieces)
+        if min(transform[num] for transform in stabilizer) == num
     )
-    # Return the list with the highest base score if generating options for pick_best, otherwise flatten the 2D list
-    # into a regular list
 
 
-def contains_symmetries(
-    options: list[tuple[list[Option], int]], option: GameState
-) -> bool:
+@cache
+def get_stabilizer(placed: int) -> tuple[tuple[int, ...], ...]:
     """
-    :param options:     The current list of potential moves
-    :param option:      The option to be added
-    :return:            If options already contains an GameState that is a transformation of option
+    Only depends on which pieces are in the board and not on where they are, so it is cached by their ids
+
+    :param placed:  A mask of the ids of the pieces in the board
+    :return:        The attribute transformations that map every piece in the board onto itself
     """
-    symmetries = get_symmetries(option.board)
-    return any(
-        any(np.array_equal(symmetry, board) for symmetry in symmetries)
-        for board in (tuple_[0][0].game_state.board for tuple_ in options)
-        # All options in options[i] have same game_state
+    ids = [num for num in range(Piece.MAX_NUM + 1) if placed >> num & 1]
+    return tuple(
+        transform
+        for transform in ATTRIBUTE_TRANSFORMS
+        if all(transform[num] == num for num in ids)
     )
 
 
-def get_symmetries(matrix: np.ndarray) -> list[np.ndarray]:
+def get_pieces_mask(pieces_set: set[Piece]) -> int:
     """
-    :param matrix:  A 2D matrix
-    :return:        All flips and rotations of :matrix:z
+    :param pieces_set:  A set of pieces
+    :return:            A mask of the ids of the pieces in :pieces_set:, which the search uses instead of the set
     """
-    flips = [np.flipud(matrix), np.fliplr(matrix)]
-    rotations = [np.rot90(matrix, i) for i in range(1, 4)]
-    rotated_flips = [np.rot90(flip, i) for flip in flips for i in range(1, 4)]
-    return rotations + flips + rotated_flips
+    return sum(1 << piece.id for piece in pieces_set)
 
 
-def get_playable_moves(
-    option: GameState,
-    pieces_set: set[Piece],
-    i: int,
-    j: int,
-    blacklist: list[bool | int],
-) -> list[Option]:
+@cache
+def get_ids(pieces: int) -> tuple[int, ...]:
     """
-    Checks what pieces can be given to the next player without them winning
+    :param pieces:  A mask of piece ids
+    :return:        The ids in :pieces:, in ascending order
+    """
+    return tuple(num for num in range(Piece.MAX_NUM + 1) if pieces >> num & 1)
 
-    :param option:      The option's GameState
-    :param pieces_set:  A set of all playable pieces
-    :param i:           First index of inserted piece
-    :param j:           Second index of inserted piece
-    :param blacklist:   A piece attribute blacklist generated by the evaluate function
-    :return:            A list of all playable moves with :option: as its GameState
-    """
-    options = [
-        Option(option.board, piece, i, j)
-        for piece in pieces_set
-        if not shared_attributes(piece.attributes, blacklist)
-    ]
-    return (
-        options
-        if len(options) > 0
-        else [Option(option.board, tuple(pieces_set)[0], i, j)]
-    )
+
+def get_canonical_form(cells: bytes) -> bytes:
+    """
+    :param cells:   A flattened board
+    :return:        The smallest of :cells: and its flips and rotations, which is the same for all of them
+    """
+    return min(cells, *get_symmetries(cells))
 
 
-def shared_attributes(
-    attributes: tuple[bool, ...], blacklist: list[bool | int]
-) -> bool:
+def get_symmetries(cells: bytes) -> list[bytes]:
     """
-    :param attributes:  A list of a pieces attributes
-    :param blacklist:   A list of a second piece's attributes
-    :return:            If :attributes: and :blacklist: have any shared attributes
+    :param cells:   A flattened board
+    :return:        All flips and rotations of :cells:
     """
-    assert len(attributes) == len(blacklist) == Piece.NUM_OF_ATTRIBUTES
-    return any(
-        blacklist[i] == BOTH_ATTRIBUTES or attributes[i] == blacklist[i]
-        for i in range(Piece.NUM_OF_ATTRIBUTES)
-    )
+    return [bytes(getter(cells)) for getter in SYMMETRY_GETTERS]
+
+
+def get_playable_pieces(pieces: int, blacklist: tuple[int, int]) -> list[int]:
+    """
+    Checks what pieces can be given to the next player without them winning
+
+    :param pieces:      A mask of the ids of all playable pieces
+    :param blacklist:   The winning attribute masks generated by the evaluate function
+    :return:            The ids of the pieces that don't have any of the winning attributes,
+                        or of the first playable piece if they all do
+    """
+    winning_set, winning_unset = blacklist
+    ids = get_ids(pieces)
+    safe_ids = [num for num in ids if not (num & winning_set or ~num & winning_unset)]
+    return safe_ids if len(safe_ids) > 0 else [ids[0]]
 
 
 def iterative_deepening(
@@ -281,8 +360,14 @@ def iterative_deepening(
     alpha: float,
     beta: float,
     max_depth: int,
+    *,
+    max_time: float = MAX_TIME,
 ) -> Option:
     """
+    Searches one ply deeper on every pass until :max_depth: is reached, the next pass would exceed :max_time:
+    or the game's outcome is decided.
+    The transposition table is kept between passes, so each pass starts from the previous pass's best moves
+
     :param board:       The current GameState
     :param piece:       The piece to use in the turn
     :param pieces_set:  A set of all piece that can be played
@@ -290,29 +375,32 @@ def iterative_deepening(
     :param alpha:       Lower bound for best_score
     :param beta:        Upper bound for best_score
     :param max_depth:   How many moves the computer can look ahead
+    :param max_time:    How many seconds the search is allowed to take
     :return:            The best score/index of the best move for :player: and the piece to play
 
     .. seealso::        https://www.chessprogramming.org/Iterative_Deepening
     """
     if max_depth <= 0:
         raise ValueError(":max_depth: has to be a positive integer!")
-    start_time = time()
+    start_time = monotonic()
+    pieces = get_pieces_mask(pieces_set)
     best_move = None
-    depth, run_time = 0, 0
-    while best_move is None or (depth <= max_depth and 1.5 * run_time < MAX_TIME):
+    depth, run_time = 1, 0
+    while best_move is None or (depth <= max_depth and 1.5 * run_time < max_time):
         best_move, score = alpha_beta(
-            Option(board, piece), deepcopy(pieces_set), sign, alpha, beta, depth
+            Option(board, piece), pieces, sign, alpha, beta, depth
         )
-        if evaluate(best_move.game_state)[0] >= MAX_SCORE:
+        # Only a proven win or loss, deeper passes can't change it
+        if abs(score) >= MAX_SCORE:
             break
         depth += 1
-        run_time = time() - start_time
+        run_time = monotonic() - start_time
     return best_move
 
 
 def alpha_beta(
     move: Option,
-    pieces_set: set[Piece],
+    pieces: int,
     sign: int,
     alpha: float,
     beta: float,
@@ -320,7 +408,7 @@ def alpha_beta(
 ) -> tuple[Option, int]:
     """
     :param move:        An option object generated by get_options or iterative_deepening
-    :param pieces_set:  A set of all piece that can be played
+    :param pieces:      A mask of the ids of all pieces that can be played
     :param sign:        The sign of the player (+1 for computer, -1 for human)
     :param alpha:       Lower bound for best_score
     :param beta:        Upper bound for best_score
@@ -329,41 +417,52 @@ def alpha_beta(
 
     .. seealso::        https://www.chessprogramming.org/Alpha-Beta\n
                         https://en.wikipedia.org/wiki/Alpha%E2%80%93beta_pruning\n
+                        https://www.chessprogramming.org/Principal_Variation_Search\n
                         https://www.chessprogramming.org/Transposition_Table\n
                         https://en.wikipedia.org/wiki/Transposition_table
     """
     original_alpha = alpha
-    tt_entry = GameState.transposition_table.get(move)
+    transposition_table = GameState.transposition_table  # Looked up once per node
+    tt_entry = transposition_table.get(move)
     if move.is_valid() and tt_entry is not None and tt_entry.depth >= depth:
-        if tt_entry.flag == TTFlag.lower_bound:
+        flag = tt_entry.flag
+        if flag is TTFlag.lower_bound:  # Enum members are singletons
             alpha = max(alpha, tt_entry.value)
-        elif tt_entry.flag == TTFlag.upper_bound:
+        elif flag is TTFlag.upper_bound:
             beta = min(beta, tt_entry.value)
-        if tt_entry.flag == TTFlag.exact or alpha >= beta:
+        if flag is TTFlag.exact or alpha >= beta:
             return tt_entry.move, tt_entry.value
 
+    # Stored in the GameState for every node but the root, as get_placements evaluated it
     val = evaluate(move.game_state)[0]
     if val == MAX_SCORE:
         return move, -val * (depth + 1)
-    if depth == 0 or len(pieces_set) <= 1:
+    if depth == 0 or pieces.bit_count() <= 1:
         return move, sign * val
 
-    pieces_set.remove(move.piece)
-    options = get_options(move.game_state, move.piece, pieces_set)
+    pieces &= ~(1 << move.piece.id)  # An int, so the children can't modify it
+    options = get_options(
+        move.game_state,
+        move.piece,
+        pieces,
+        sign,
+        tt_entry.move if tt_entry is not None else None,
+    )
     best_option, best_score = None, -inf
     for option in options:
-        score = -alpha_beta(option, pieces_set, -sign, -beta, -alpha, depth - 1)[1]
-        if score > best_score:
-            best_option = option
-            best_score = score
-        alpha = max(alpha, best_score)
-        if alpha >= beta:
-            break
-    pieces_set.add(move.piece)
+        # After the first move, a null window only proves if a move is better than the best one
+        window_beta = beta if best_option is None else alpha + 1
+        score = -alpha_beta(option, pieces, -sign, -window_beta, -alpha, depth - 1)[1]
+        if window_beta < beta and alpha < score < beta:  # It is, search its exact score
+            score = -alpha_beta(option, pieces, -sign, -beta, -alpha, depth - 1)[1]
+        if score > best_score:  # Alpha can only change along with the best score
+            best_option, best_score = option, score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
     assert best_option is not None and best_score != -inf
 
     flag = Transposition.get_flag(best_score, original_alpha, beta)
-    GameState.transposition_table[move] = Transposition(
-        best_option, best_score, flag, depth
-    )
+    transposition_table[move] = Transposition(best_option, best_score, flag, depth)
     return best_option, best_score
@@ -11,7 +11,6 @@ from __future__ import annotations
 __version__ = "1.4.0"
 __author__ = "Eric G.D"
 
-from copy import deepcopy
 from math import inf
 import threading
 
@@ -30,13 +29,16 @@ from src.ai import (
     pick_starting_piece,
 )
 from src.constants import (
-    Colors,
+    CONFIRMED_COLOR,
+    NO_PIECE,
+    SELECTED_COLOR,
     GameMode,
     Player,
     next_player,
 )
 from src.option import GameState, Option
 from src.piece import (
+    PIECES,
     Cell,
     Piece,
 )
@@ -71,7 +73,7 @@ class Board(GridLayout):
     def __init__(self, **kwargs):
         super().__init__()
         self.rows = self.cols = Board.LENGTH
-        self.first_player: Player = kwargs.get("first_player", Player.computer)
+        self.first_player: Player = kwargs.get("first_player") or Player.human
         self.current_player: Player = self.first_player
         self.game_mode: GameMode = kwargs.get("game_mode", GameMode.single_player)
         difficulty = kwargs.get("difficulty")
@@ -157,8 +159,8 @@ class Board(GridLayout):
         pieces_set = self.pieces_bar.pieces_set
         depth = Board.DIFFICULTY["baby"] if self.turn_num < 5 else self.depth
         if depth <= 0:
-            return pick_best(board, piece, deepcopy(pieces_set))
-        sign = 1 if self.current_player == Player.computer else -1
+            return pick_best(board, piece, pieces_set)
+        sign = int(self.current_player)
         return iterative_deepening(board, piece, pieces_set, sign, -inf, inf, depth)
 
     def on_click(self, touch) -> None:
@@ -239,6 +241,7 @@ class Board(GridLayout):
         self.turn_num = 1
         self.pieces_bar.reset()
         GameState.transposition_table.clear()
+        GameState.evaluation_table.clear()
         self.first_move()
 
     def is_full(self) -> bool:
@@ -251,7 +254,13 @@ class Board(GridLayout):
         """
         :return:                A simplified version of board
         """
-        return GameState([[cell.piece for cell in row] for row in self.cell_list])
+        return GameState(
+            bytes(
+                NO_PIECE if cell.piece is None else cell.piece.id
+                for row in self.cell_list
+                for cell in row
+            )
+        )
 
 
 class PiecesBar(BoxLayout):
@@ -268,8 +277,10 @@ class PiecesBar(BoxLayout):
             raise ValueError(f":board: needs to be a Board object, not {type(board)}!")
         self.board: Board = board
         self.selected: None | Cell = None
+        self.selected_index: None | int = None
         self.confirmed: None | Cell = None
         self.pieces_set: set[Piece] = PiecesBar.generate_pieces_set()
+        self.cells: tuple[Cell, ...] = self.generate_cells()
         self.widgets: list[Cell] = []
         self.add_pieces()
         self.confirm_button: Button = Button(text="Confirm", size_hint_x=None)
@@ -286,18 +297,27 @@ class PiecesBar(BoxLayout):
         Generates a set of all playable pieces
         :return:    The generated set
         """
-        return {Piece(num) for num in range(Piece.MAX_NUM + 1)}
+        return set(PIECES)
+
+    def generate_cells(self) -> tuple[Cell, ...]:
+        """
+        Generates a cell for every piece, which are reused by every game
+        :return:    The generated cells, ordered by id
+        """
+        cells = tuple(Cell(piece) for piece in PIECES)
+        for cell in cells:
+            cell.bind(on_release=self.select)
+        return cells
 
     def add_pieces(self) -> None:
         """
-        Adds all the pieces in :self.pieces_set: to the layout
+        Adds the cells of all the pieces to the layout
         :return:    None
         """
-        for piece in self.pieces_set:
-            widget = Cell(piece)
-            widget.bind(on_release=self.select)
+        for widget in self.cells:
+            widget.canvas.before.clear()  # Could still be highlighted from the last game
             self.add_widget(
-                widget, -piece.id
+                widget, -widget.piece.id
             )  # Inserts the widget based on id number in ascending order
             self.widgets.append(widget)
 
@@ -318,9 +338,10 @@ class PiecesBar(BoxLayout):
             self.confirmed = self.selected
         else:  # Touch is a piece (function was called from insert)
             self.confirmed = self.get_cell_from_piece(piece)
-        self.confirmed.set_background_color(Colors.confirmed)
+        self.confirmed.set_background_color(CONFIRMED_COLOR)
         self.board.current_player = next_player(self.board.current_player)
         self.selected = None
+        self.selected_index = None
         if (
             self.board.game_mode == GameMode.single_player
             and self.board.current_player == Player.computer
@@ -351,10 +372,11 @@ class PiecesBar(BoxLayout):
         self.remove_widget(self.confirmed)
         self.confirmed = None
 
-    def select(self, touch: Cell) -> None:
+    def select(self, touch: Cell, index: None | int = None) -> None:
         """
         Selects a piece
         :param touch:   The piece to select
+        :param index:   The index of :touch: in :self.widgets: (Looked up if not given)
         :return:        None
         """
         if self.confirmed is not None:
@@ -362,7 +384,8 @@ class PiecesBar(BoxLayout):
         if self.selected is not None:
             self.selected.canvas.before.clear()
         self.selected = touch
-        touch.set_background_color(Colors.selected)
+        self.selected_index = self.widgets.index(touch) if index is None else index
+        touch.set_background_color(SELECTED_COLOR)
 
     def reset(self) -> None:
         """
@@ -373,6 +396,7 @@ class PiecesBar(BoxLayout):
         self.widgets.clear()
         self.confirmed = None
         self.selected = None
+        self.selected_index = None
         self.pieces_set = PiecesBar.generate_pieces_set()
         self.add_pieces()
         self.add_widget(self.confirm_button)
@@ -383,6 +407,6 @@ class PiecesBar(BoxLayout):
         :return:    None
         """
         if self.selected is not None:
-            self.selected.set_background_color(Colors.selected)
+            self.selected.set_background_color(SELECTED_COLOR)
         elif self.confirmed is not None:
-            self.confirmed.set_background_color(Colors.confirmed)
+            self.confirmed.set_background_color(CONFIRMED_COLOR)
@@ -7,7 +7,7 @@ This module contains all the enums and constants used by the other modules of th
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 __version__ = "1.4.0"
 __author__ = "Eric G.D"
@@ -16,11 +16,9 @@ MAX_SCORE: int = 10**5
 MAX_TIME: int = 2
 
 NO_INDEX: int = -1
+NO_PIECE: int = 0xFF
 HASH_BITS: int = 64
 
-NO_ATTRIBUTES: int = -1
-BOTH_ATTRIBUTES: int = -2
-
 
 class GameMode(Enum):
     """
@@ -35,17 +33,18 @@ class GameMode(Enum):
     multi_player = 1
 
 
-class Player(Enum):
+class Player(IntEnum):
     """
-    Class Player(Enum):
-    -------------------
+    Class Player(IntEnum):
+    ----------------------
 
     An enum containing the types/numbers of the current players
     Used by Board to assign minimising/maximising signs to NegaMax and to display the end of game message
+    The values double as the NegaMax signs, so they can be passed to the AI as plain ints
     """
 
-    human = 1
-    computer = 2
+    human = -1
+    computer = 1
 
 
 class TTFlag(Enum):
@@ -71,7 +70,19 @@ def next_player(player: Player) -> Player:
     :param player:  The current player
     :return:        The player who is next to play
     """
-    return Player.human if player == Player.computer else Player.computer
+    return Player(-player)
+
+
+SELECTED_COLOR: tuple[float, ...] = (0.8, 0.8, 0.2, 0.8)
+CONFIRMED_COLOR: tuple[float, ...] = (0.2, 0.8, 0.2, 0.8)
+BOARD_COLOR: tuple[float, ...] = (0.5, 0.5, 0.5, 1)
+PIECES_BAR_COLOR: tuple[float, ...] = (0.2, 0.2, 0.5, 1)
+WHITE: tuple[float, ...] = (1, 1, 1, 1)
+CYAN: tuple[float, ...] = (0.2, 0.8, 0.8, 1)
+GREEN: tuple[float, ...] = (0.2, 0.8, 0.2, 1)
+BLUE: tuple[float, ...] = (0.2, 0.2, 0.8, 1)
+RED: tuple[float, ...] = (0.8, 0.2, 0.2, 1)
+TRANSPARENT: tuple[float, ...] = (1, 1, 1, 0)
 
 
 class Colors:
@@ -79,16 +90,17 @@ class Colors:
     Class Colors:
     -------------
 
-    A class containing rgba tuples for colors used in the UI
+    A namespace of the rgba tuples for colors used in the UI, used by quarto.kv
+    Python code should import the module level constants instead, as they are a single global lookup
     """
 
-    selected = (0.8, 0.8, 0.2, 0.8)
-    confirmed = (0.2, 0.8, 0.2, 0.8)
-    board = (0.5, 0.5, 0.5, 1)
-    pieces_bar = (0.2, 0.2, 0.5, 1)
-    white = (1, 1, 1, 1)
-    cyan = (0.2, 0.8, 0.8, 1)
-    green = (0.2, 0.8, 0.2, 1)
-    blue = (0.2, 0.2, 0.8, 1)
-    red = (0.8, 0.2, 0.2, 1)
-    transparent = (1, 1, 1, 0)
+    selected = SELECTED_COLOR
+    confirmed = CONFIRMED_COLOR
+    board = BOARD_COLOR
+    pieces_bar = PIECES_BAR_COLOR
+    white = WHITE
+    cyan = CYAN
+    green = GREEN
+    blue = BLUE
+    red = RED
+    transparent = TRANSPARENT
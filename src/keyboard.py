@@ -17,6 +17,7 @@ import sys
 
 from kivy.core.window import Keyboard as KivyKeyboard
 from kivy.core.window import Window
+from kivy.uix.screenmanager import Screen
 from kivy.uix.widget import Widget
 
 from src.board import PiecesBar
@@ -40,6 +41,9 @@ class Keyboard(Widget):  # Is a subclass of widget to provide window resizing su
             self._disable_keyboard, self
         )
         self._app: QuartoApp = app
+        self._active_pieces_bar: PiecesBar | None = None
+        self._app.sm.bind(current_screen=self._on_screen_changed)
+        self._on_screen_changed(self._app.sm, self._app.sm.current_screen)
         self.key_down: Callable[..., None] = lambda *args: self._on_key_down(
             args[1][1]
         )  # Get pressed key from args
@@ -47,18 +51,25 @@ class Keyboard(Widget):  # Is a subclass of widget to provide window resizing su
         self._keyboard.bind(on_key_down=self.key_down)
         self._keyboard.bind(on_key_up=self.key_up)
 
+    def _on_screen_changed(self, _, screen: Screen) -> None:
+        """
+        This function is called whenever the ScreenManager's current screen changes
+        Caches the pieces bar of the new screen, so key presses don't need to check the screen's type
+        :param screen:  The new current screen
+        :return:        None
+        """
+        self._active_pieces_bar = (
+            screen.pieces_bar if isinstance(screen, GameScreen) else None
+        )
+
     def _on_key_down(self, key: str) -> None:
         """
         This function is called whenever a key is pressed
         :param key:     The key that was pressed
         :return:        None
         """
-        pieces_bar = (
-            self._app.sm.current_screen.pieces_bar
-            if isinstance(self._app.sm.current_screen, GameScreen)
-            else None
-        )
-        if isinstance(pieces_bar, PiecesBar) and pieces_bar.confirmed is None:
+        pieces_bar = self._active_pieces_bar
+        if pieces_bar is not None and pieces_bar.confirmed is None:
             Keyboard.__keyboard_select(pieces_bar, key)
 
     def _on_key_up(self, key: str) -> None:
@@ -68,7 +79,7 @@ class Keyboard(Widget):  # Is a subclass of widget to provide window resizing su
         :return:        None
         """
         if key == "escape":
-            if not isinstance(self._app.sm.current_screen, GameScreen):
+            if self._active_pieces_bar is None:
                 sys.exit()
             self.toggle_pause_menu()
 
@@ -94,9 +105,7 @@ class Keyboard(Widget):  # Is a subclass of widget to provide window resizing su
         """
         if key in ("left", "right"):
             selected_index = (
-                pieces_bar.widgets.index(pieces_bar.selected)
-                if pieces_bar.selected is not None
-                else 0
+                pieces_bar.selected_index if pieces_bar.selected is not None else 0
             )
             relative_widget_index = 1 if key == "right" else -1
             relative_widget_index = (
@@ -105,7 +114,7 @@ class Keyboard(Widget):  # Is a subclass of widget to provide window resizing su
                 else relative_widget_index
             )
             index = (selected_index + relative_widget_index) % len(pieces_bar)
-            pieces_bar.select(pieces_bar.widgets[index])
+            pieces_bar.select(pieces_bar.widgets[index], index)
         elif key == "enter" and pieces_bar.selected is not None:
             pieces_bar.confirm()
 
@@ -14,9 +14,7 @@ from collections.abc import Iterable
 from random import getrandbits
 from typing import Any
 
-import numpy as np
-
-from src.constants import HASH_BITS, NO_INDEX, TTFlag
+from src.constants import HASH_BITS, NO_INDEX, NO_PIECE, TTFlag
 from src.piece import Piece
 
 
@@ -26,32 +24,43 @@ class Option:
     -------------
 
     Contains all the data of a single option (move) the computer can make
+    Its fields are plain slots rather than properties, as they are read for every node of the search
     """
 
+    # Millions are created per search
+    __slots__ = ("game_state", "piece", "index", "__hash")
+
     def __init__(
         self,
-        game_state: GameState | np.ndarray,
+        game_state: GameState | bytes,
         piece: Piece,
         i: int = NO_INDEX,
         j: int = NO_INDEX,
     ):
-        self.__game_state: GameState = (
+        self.game_state: GameState = (
             game_state if isinstance(game_state, GameState) else GameState(game_state)
         )
-        self.__piece: Piece = piece
-        self.__index: tuple[int, int] = (i, j)
+        self.piece: Piece = piece
+        self.index: tuple[int, int] = (i, j)
+        # The transposition table key, computed on first use
+        self.__hash: int | None = None
 
     def __repr__(self) -> str:
-        return f"Option({self.__game_state!r}, {self.__piece!r}, {self.__index[0]}, {self.__index[1]})"
+        return f"Option({self.game_state!r}, {self.piece!r}, {self.index[0]}, {self.index[1]})"
 
     def __hash__(self) -> int:
-        return hash(self.__game_state) ^ GameState.selected_table[self.__piece.id]
+        # Probed and stored by alpha_beta and probed by get_placements
+        if self.__hash is None:
+            self.__hash = (
+                hash(self.game_state) ^ GameState.selected_table[self.piece.id]
+            )
+        return self.__hash
 
     def __eq__(self, other: Any) -> bool:
         return (
             isinstance(other, Option)
-            and self.__game_state == other.__game_state
-            and self.__piece == other.piece
+            and self.game_state == other.game_state
+            and self.piece == other.piece
         )
 
     def is_valid(self) -> bool:
@@ -60,36 +69,26 @@ class Option:
         """
         return 0 <= self.i < GameState.LENGTH and 0 <= self.j < GameState.LENGTH
 
-    @property
-    def game_state(self) -> GameState:
-        return self.__game_state
-
-    @property
-    def index(self) -> tuple[int, int]:
-        return self.__index
-
     @property
     def i(self) -> int:
-        return self.__index[0]
+        return self.index[0]
 
     @property
     def j(self) -> int:
-        return self.__index[1]
-
-    @property
-    def piece(self) -> Piece:
-        return self.__piece
+        return self.index[1]
 
 
 class Transposition:
+    __slots__ = ("move", "value", "flag", "depth")  # One is stored per searched node
+
     def __init__(self, move: Option, value: int, flag: TTFlag, depth: int):
-        self.__move: Option = move
-        self.__value: int = value
-        self.__flag: TTFlag = flag
-        self.__depth: int = depth
+        self.move: Option = move
+        self.value: int = value
+        self.flag: TTFlag = flag
+        self.depth: int = depth
 
     def __repr__(self) -> str:
-        return f"Transposition({self.__value}, {str(self.__flag)}, {self.__depth})"
+        return f"Transposition({self.value}, {str(self.flag)}, {self.depth})"
 
     @staticmethod
     def get_flag(value: int, alpha: float, beta: float) -> TTFlag:
@@ -107,46 +106,40 @@ class Transposition:
             return TTFlag.lower_bound
         return TTFlag.exact
 
-    @property
-    def move(self) -> Option:
-        return self.__move
-
-    @property
-    def value(self) -> int:
-        return self.__value
-
-    @property
-    def flag(self) -> TTFlag:
-        return self.__flag
-
-    @property
-    def depth(self) -> int:
-        return self.__depth
-
 
 class GameState:
+    __slots__ = ("__board", "__hash", "evaluation")
+
     LENGTH: int = 4
-    zobrist_table: list[list[list[int]]] = []
+    # Indexed by the flattened cell index and piece id
+    zobrist_table: list[list[int]] = []
     selected_table: list[int] = []
     transposition_table: dict[Option, Transposition] = {}
+    evaluation_table: dict[bytes, tuple[int, tuple[int, int]]] = {}
 
-    def __init__(self, state: np.ndarray | list[list[Piece]]):
-        if not len(state) == len(state[0]) == GameState.LENGTH:
+    def __init__(self, state: bytes):
+        """
+        :param state:   The board flattened row by row, with a piece id or NO_PIECE in every cell
+        """
+        if len(state) != GameState.LENGTH**2:
             raise ValueError(
-                f"Invalid dimensions for :state:, should be a {GameState.LENGTH}x{GameState.LENGTH} array!"
+                f"Invalid length for :state:, should contain {GameState.LENGTH**2} cells!"
             )
-        self.__board: np.ndarray = np.array(state)
+        self.__board: bytes = bytes(state)
+        # Both are computed on first use, as the board never changes
+        self.__hash: int | None = None
+        self.evaluation: tuple[int, tuple[int, int]] | None = None  # Set by evaluate
         if not GameState.zobrist_table:
             GameState.__zobrist_init()
 
     @property
-    def board(self) -> np.ndarray:
+    def board(self) -> bytes:
         return self.__board
 
-    def __getitem__(self, key: Any) -> np.ndarray:
+    def __getitem__(self, key: Any) -> int | bytes:
         return self.__board[key]
 
-    def __iter__(self) -> Iterable[np.ndarray]:
+    def __iter__(self) -> Iterable[int]:
         return iter(self.board)
 
     def __hash__(self) -> int:
@@ -157,22 +150,24 @@ class GameState:
         .. seealso:     https://en.wikipedia.org/wiki/Zobrist_hashing
                         https://www.chessprogramming.org/Zobrist_Hashing
         """
-        hash_ = 0
-        for i in range(len(self.board)):
-            for j in range(len(self.board[i])):
-                if self.board[i][j] is None:
-                    continue
-                hash_ ^= GameState.zobrist_table[i][j][self.board[i][j].id]
-        return hash_
+        if self.__hash is None:
+            hash_ = 0
+            for cell_table, piece_id in zip(
+                GameState.zobrist_table, self.__board, strict=True
+            ):
+                if piece_id != NO_PIECE:
+                    hash_ ^= cell_table[piece_id]
+            self.__hash = hash_
+        return self.__hash
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, GameState) and np.array_equal(self.board, other.board)
+        return isinstance(other, GameState) and self.board == other.board
 
     def __len__(self) -> int:
         return len(self.board)
 
     def __repr__(self) -> str:
-        return f"Gamestate({self.__board.tolist()!r})"
+        return f"Gamestate({self.__board!r})"
 
     @staticmethod
     def __zobrist_init() -> None:
@@ -182,12 +177,9 @@ class GameState:
         """
         table = [
             [
-                [
-                    getrandbits(HASH_BITS) for _ in range(Piece.MAX_NUM + 1)
-                ]  # For pieces in the board
-                for _ in range(GameState.LENGTH)
-            ]
-            for _ in range(GameState.LENGTH)
+                getrandbits(HASH_BITS) for _ in range(Piece.MAX_NUM + 1)
+            ]  # For pieces in the board
+            for _ in range(GameState.LENGTH**2)
         ]
         GameState.zobrist_table[:] = table
         GameState.selected_table[:] = [
@@ -7,10 +7,11 @@ Contains the declarations of the Piece and Cell classes.
 
 from __future__ import annotations
 
-__all__ = ["Piece", "Cell"]
+__all__ = ["Piece", "PIECES", "Cell"]
 __version__ = "1.4.0"
 __author__ = "Eric G.D"
 
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -25,16 +26,38 @@ class Piece:
     Class Piece
     -----------
 
-    Contains the data of a piece, including it's id number, attributes tuple and image path
+    Contains the data of a piece, including it's id number (whose bits are its attributes) and image path
     """
 
+    __slots__ = ("__id", "__label")
+
     NUM_OF_ATTRIBUTES: int = 4
     MAX_NUM: int = (2**NUM_OF_ATTRIBUTES) - 1
-
-    def __init__(self, num: int):
-        self.__id: int = num
-        self.__attributes: tuple[bool, ...] = Piece.get_attributes(num)
-        self.__image: Path = Path("assets", f"piece_{str(num).zfill(2)}.png")
+    ATTRIBUTE_STRINGS: tuple[tuple[str, str], ...] = (
+        ("Small", "Large"),
+        ("Square", "Round"),
+        ("Solid", "Hollow"),
+        ("Black", "White"),
+    )
+    __instances: dict[int, Piece] = {}
+
+    def __new__(cls, num: int) -> Piece:
+        """
+        Pieces are immutable, so there is a single instance per id and its attributes are only computed once
+        :param num:     The piece's ID
+        :return:        The piece with the id :num:
+        """
+        piece = Piece.__instances.get(num)
+        if piece is None:
+            attributes = Piece.get_attributes(num)  # Validates :num:
+            piece = super().__new__(cls)
+            piece.__id = num
+            piece.__label = Piece.get_label(attributes)
+            Piece.__instances[num] = piece
+        return piece
+
+    def __getnewargs__(self) -> tuple[int]:
+        return (self.__id,)
 
     @staticmethod
     def get_attributes(num: int) -> tuple[bool, ...]:
@@ -46,11 +69,26 @@ class Piece:
             raise TypeError(f":num: needs to be an int, not {type(num)}!")
         if not 0 <= num <= Piece.MAX_NUM:
             raise ValueError(f":num: needs to be between 0 and {Piece.MAX_NUM}.")
-        binary_str = format(num, "b").zfill(Piece.NUM_OF_ATTRIBUTES)
-        return tuple(bit != "0" for bit in binary_str)
+        return tuple(
+            bool(num >> bit & 1) for bit in reversed(range(Piece.NUM_OF_ATTRIBUTES))
+        )  # The first attribute is the most significant bit
+
+    @staticmethod
+    def get_label(attributes: tuple[bool, ...]) -> str:
+        """
+        :param attributes:  The attributes of a piece
+        :return:            A string containing the names of the attributes
+        """
+        names = (
+            strings[att]
+            for strings, att in zip(Piece.ATTRIBUTE_STRINGS, attributes, strict=True)
+        )
+        return f"({', '.join(names)})"
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Piece) and other.__id == self.__id
+        return self is other or (
+            isinstance(other, Piece) and other.__id == self.__id
+        )  # Pieces are interned, so equal pieces are almost always the same object
 
     def __hash__(self) -> int:
         return self.__id
@@ -60,46 +98,53 @@ class Piece:
 
     def __str__(self) -> str:
         """
-        :return: A string containing the piece's attributes
+        :return: A string containing the piece's attributes (Built once, when the piece is created)
         """
-        attribute_strings = (
-            ("Small", "Large"),
-            ("Square", "Round"),
-            ("Solid", "Hollow"),
-            ("Black", "White"),
-        )
-        attributes = [1 if att else 0 for att in self.__attributes]
-        return f"({', '.join(attribute_strings[i][att] for i, att in enumerate(attributes))})"
+        return self.__label
 
     @property
     def attributes(self) -> tuple[bool, ...]:
-        return self.__attributes
+        return ATTRIBUTES[self.__id]
 
     @property
     def is_large(self) -> bool:
-        return self.__attributes[0]
+        return self.__id & 0b1000 != 0
 
     @property
     def is_round(self) -> bool:
-        return self.__attributes[1]
+        return self.__id & 0b0100 != 0
 
     @property
     def is_hollow(self) -> bool:
-        return self.__attributes[2]
+        return self.__id & 0b0010 != 0
 
     @property
     def is_white(self) -> bool:
-        return self.__attributes[3]
+        return self.__id & 0b0001 != 0
 
     @property
-    def image(self) -> Path:
-        return self.__image
+    def image(self) -> str:
+        """
+        :return:    The path of the piece's image, as the string kivy expects for a source
+        """
+        return IMAGES[self.__id]
 
     @property
     def id(self) -> int:
         return self.__id
 
 
+ATTRIBUTES: tuple[tuple[bool, ...], ...] = tuple(
+    Piece.get_attributes(num) for num in range(Piece.MAX_NUM + 1)
+)  # The attributes of every piece, indexed by id, as the id already holds them as bits
+IMAGES: tuple[str, ...] = tuple(
+    str(Path("assets", f"piece_{num:02d}.png")) for num in range(Piece.MAX_NUM + 1)
+)  # The image path of every piece, indexed by id, so each path is only joined once
+PIECES: tuple[Piece, ...] = tuple(
+    Piece(num) for num in range(Piece.MAX_NUM + 1)
+)  # Every piece, indexed by id
+
+
 class Cell(ButtonBehavior, AsyncImage):
     """
     class Cell(ButtonBehavior, AsyncImage)
@@ -109,7 +154,7 @@ class Cell(ButtonBehavior, AsyncImage):
     This class is a graphic wrapper for Piece
     """
 
-    BLANK_IMAGE = Path("assets", "blank.png")
+    BLANK_IMAGE: str = str(Path("assets", "blank.png"))
 
     def __init__(self, piece: None | int | Piece = None):
         ButtonBehavior.__init__(self)
@@ -117,32 +162,36 @@ class Cell(ButtonBehavior, AsyncImage):
         self.piece = piece
 
     @property
-    def piece(self) -> Piece:
+    def piece(self) -> Piece | None:
         return self.__piece
 
     @piece.setter
     def piece(self, p: None | int | Piece):
-        if isinstance(p, int):
-            self.__piece = Piece(p)
-        elif not (p is None or isinstance(p, Piece)):
-            raise TypeError(f"{type(p)} is not a valid type for :p:!")
-        self.__piece: Piece = p
-        self.source = str(p.image if p is not None else Cell.BLANK_IMAGE)
+        # Board and PiecesBar pass pieces
+        if p is not None and not isinstance(p, Piece):
+            if not isinstance(p, int):
+                raise TypeError(f"{type(p)} is not a valid type for :p:!")
+            if not 0 <= p <= Piece.MAX_NUM:
+                raise ValueError(f":p: needs to be between 0 and {Piece.MAX_NUM}.")
+            p = PIECES[p]
+        self.__piece: Piece | None = p
+        self.source = Cell.BLANK_IMAGE if p is None else p.image
 
     def set_background_color(self, color: tuple[int, int, int, int]) -> None:
         """
         Change the background color of the cell
-        This function is a wrapper for __set_bg_color, which is called by kivy.Clock
+        This function is a wrapper for __set_bg_color, which is called by kivy.Clock once the cell is laid out
         :param color:   A tuple containing the rgba value of the color
         :return:        None
         """
         self.canvas.before.clear()
-        Clock.schedule_once(lambda *_: self.__set_bg_color(color))
+        Clock.schedule_once(partial(self.__set_bg_color, color))
 
-    def __set_bg_color(self, color: tuple[int, int, int, int]) -> None:
+    def __set_bg_color(self, color: tuple[int, int, int, int], *_) -> None:
         """
         Places a colored rectangle behind the canvas of the cell
         :param color:   The color of the rectangle to place
+        :param _:       The time since it was scheduled, when called by kivy.Clock (Unused)
         :return:        None
         """
         with self.canvas.before: